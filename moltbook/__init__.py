@@ -11,23 +11,22 @@ Usage:
     moltbook submolts
 """
 
+import bisect
+import contextlib
+import functools
 import json
 import os
+import re
 import sys
-import time
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 import click
-import requests
-from rich.console import Console
-from rich.json import JSON
-from rich.table import Table
-from rich.text import Text
-from rich.panel import Panel
 
-console = Console()
+# requests and rich are imported lazily inside the functions that need them,
+# so `moltbook --help` and shell completion don't pay their import cost.
 
 BASE_URL = "https://www.moltbook.com/api/v1"
 DEFAULT_TIMEOUT = 30
@@ -35,6 +34,177 @@ MAX_RETRIES = 3
 RETRY_STATUSES = {429, 500, 502, 503, 504}
 RETRY_BACKOFF = 1.5
 CONFIG_PATH = Path.home() / ".config" / "moltbook" / "credentials.json"
+CACHE_PATH = Path.home() / ".cache" / "moltbook" / "http.sqlite"
+CACHE_TTL = 300
+# Per-endpoint overrides: community listings barely change, single posts do.
+CACHE_URL_TTLS = {"*/submolts": 3600, "*/posts/*": 60}
+
+# Set by the --no-cache flag on the command group.
+_CACHE_DISABLED = False
+
+# Subcommands that will hit the API, and so benefit from connection warming.
+_NETWORK_COMMANDS = {
+    "search",
+    "browse",
+    "comments",
+    "fetch",
+    "thread",
+    "submolts",
+    "stats",
+    "whoami",
+}
+
+# Newlines to spaces, carriage returns dropped, in one translate pass.
+_TRUNC_TABLE = str.maketrans({"\n": " ", "\r": None})
+
+# Upvote buckets for coloring browse rows: <=100 dim, <=1000 green, etc.
+_VOTE_BUCKETS = (100, 1000, 10000)
+_VOTE_COLORS = ("dim", "green", "bold yellow", "bold red")
+
+
+@functools.lru_cache(maxsize=1)
+def get_console():
+    """Build the shared rich console on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+# Matches rich's tag grammar: tags start with a lowercase letter, '#', '@'
+# or '/'. Capitalized bracketed text is literal to rich and must survive,
+# as must anything escaped with a leading backslash.
+_MARKUP_RE = re.compile(r"(?<!\\)\[/?[a-z#@][^\[\]]*\]")
+
+
+def escape_markup(text: str) -> str:
+    """Escape literal brackets so rich doesn't read them as style tags."""
+    return text.replace("[", "\\[")
+
+
+def _strip_markup(text: str) -> str:
+    return _MARKUP_RE.sub("", text).replace("\\[", "[")
+
+
+def cprint(text: str = ""):
+    """Print a markup-formatted line.
+
+    On a terminal this goes through the rich console; when stdout is a pipe
+    the style tags are stripped with a regex and written plainly, skipping
+    rich's markup tokenizer (and its import) entirely.
+    """
+    if sys.stdout.isatty():
+        get_console().print(text)
+    else:
+        print(_strip_markup(text))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_orjson():
+    """Return the orjson module if installed (the `fast` extra), else None."""
+    try:
+        import orjson
+
+        return orjson
+    except ImportError:
+        return None
+
+
+def loads_json(data: bytes) -> dict:
+    """Parse JSON straight from response bytes, via orjson when available.
+
+    Skips the bytes -> str decode that response.json() would do.
+    """
+    orjson = _get_orjson()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def emit_json(data):
+    """Write raw JSON bytes to stdout for --json-out.
+
+    Machine consumers don't want rich's syntax highlighting, and skipping
+    console.print_json avoids a full re-parse of the serialized payload.
+    """
+    orjson = _get_orjson()
+    payload = orjson.dumps(data) if orjson is not None else json.dumps(data).encode()
+    sys.stdout.buffer.write(payload)
+    sys.stdout.buffer.write(b"\n")
+
+
+@functools.lru_cache(maxsize=1)
+def get_session():
+    """Build the shared HTTP session on first use.
+
+    Sequential commands reuse one pooled keep-alive connection instead of
+    paying connect+TLS per request. Retries on 429/5xx happen inside the
+    connection layer, so a retried request reuses the pooled socket. When
+    requests-cache is installed (the `cache` extra), idempotent GETs are
+    served from an on-disk cache with per-endpoint TTLs, so repeat CLI
+    invocations skip the network entirely.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    try:
+        from requests_cache import CachedSession
+
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        session = CachedSession(
+            str(CACHE_PATH),
+            expire_after=CACHE_TTL,
+            urls_expire_after=CACHE_URL_TTLS,
+            allowable_methods=("GET",),
+            # Key entries on the auth header too, so anonymous responses
+            # aren't replayed after the user configures an API key.
+            match_headers=["Authorization"],
+        )
+    except ImportError:
+        session = requests.Session()
+    session.headers["User-Agent"] = "Moltbook-Reader/1.0"
+    # Advertise compression explicitly; only offer brotli when a decoder is
+    # installed (the `fast` extra), otherwise the body would arrive undecodable.
+    accept_encoding = "gzip, deflate"
+    try:
+        import brotli  # noqa: F401
+
+        accept_encoding += ", br"
+    except ImportError:
+        pass
+    session.headers["Accept-Encoding"] = accept_encoding
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=MAX_RETRIES,
+                status_forcelist=list(RETRY_STATUSES),
+                backoff_factor=RETRY_BACKOFF,
+                respect_retry_after_header=True,
+                allowed_methods=["GET"],
+                # Hand the final response back so raise_for_status surfaces
+                # the HTTP error, matching the old manual-loop behavior.
+                raise_on_status=False,
+            ),
+        ),
+    )
+    return session
+
+
+@functools.lru_cache(maxsize=1)
+def _read_config(mtime_ns: int) -> dict:
+    """Parse the credentials file, cached on its mtime.
+
+    Repeat calls within a process (and across commands in one run) skip the
+    open+parse as long as the file hasn't changed.
+    """
+    try:
+        with open(CONFIG_PATH) as f:
+            return json.load(f)
+    except (json.JSONDecodeError, IOError):
+        return {}
 
 
 def get_api_key() -> Optional[str]:
@@ -45,62 +215,91 @@ def get_api_key() -> Optional[str]:
         return api_key
 
     # Then check config file
-    if CONFIG_PATH.exists():
-        try:
-            with open(CONFIG_PATH) as f:
-                config = json.load(f)
-                return config.get("api_key")
-        except (json.JSONDecodeError, IOError):
-            pass
+    try:
+        st = CONFIG_PATH.stat()
+    except OSError:
+        return None
+    return _read_config(st.st_mtime_ns).get("api_key")
+
+
+_API_KEY_CACHE: Optional[tuple[Optional[str]]] = None
 
-    return None
 
+def resolve_api_key() -> Optional[str]:
+    """Resolve the API key once per process.
+
+    Caches the outcome — including "no key configured" — so commands that
+    need the key in more than one place don't re-stat the credentials file.
+    """
+    global _API_KEY_CACHE
+    if _API_KEY_CACHE is None:
+        _API_KEY_CACHE = (get_api_key(),)
+    return _API_KEY_CACHE[0]
+
+
+def make_request(
+    endpoint: str, params: Optional[dict] = None, api_key: Optional[str] = None
+) -> dict:
+    """Make a GET request to Moltbook API.
+
+    Pass api_key (from resolve_api_key) for authenticated endpoints; the
+    key is not re-resolved here.
+    """
+    import requests
 
-def make_request(endpoint: str, params: Optional[dict] = None, auth: bool = False) -> dict:
-    """Make a GET request to Moltbook API."""
     url = f"{BASE_URL}/{endpoint}"
-    headers = {"User-Agent": "Moltbook-Reader/1.0"}
+    headers = {"Authorization": f"Bearer {api_key}"} if api_key else None
 
-    if auth:
-        api_key = get_api_key()
-        if api_key:
-            headers["Authorization"] = f"Bearer {api_key}"
+    session = get_session()
+    if _CACHE_DISABLED and hasattr(session, "cache_disabled"):
+        cache_cm = session.cache_disabled()
+    else:
+        cache_cm = contextlib.nullcontext()
 
     try:
-        for attempt in range(MAX_RETRIES + 1):
-            response = requests.get(
+        with cache_cm:
+            response = session.get(
                 url, headers=headers, params=params, timeout=DEFAULT_TIMEOUT
             )
-            if response.status_code in RETRY_STATUSES and attempt < MAX_RETRIES:
-                retry_after = response.headers.get("Retry-After")
-                if retry_after and retry_after.isdigit():
-                    wait_seconds = int(retry_after)
-                else:
-                    wait_seconds = int(RETRY_BACKOFF ** attempt)
-                time.sleep(wait_seconds)
-                continue
-            response.raise_for_status()
-            return response.json()
+        response.raise_for_status()
+        return loads_json(response.content)
     except requests.exceptions.Timeout:
-        console.print("[red]Error: Request timed out[/red]")
-        sys.exit(1)
+        raise click.ClickException("Request timed out")
     except requests.exceptions.ConnectionError:
-        console.print("[red]Error: Could not connect to Moltbook[/red]")
-        sys.exit(1)
+        raise click.ClickException("Could not connect to Moltbook")
     except requests.exceptions.HTTPError as e:
-        console.print(f"[red]Error: HTTP {e.response.status_code}[/red]")
-        sys.exit(1)
+        raise click.ClickException(f"HTTP {e.response.status_code}")
     except json.JSONDecodeError:
-        console.print("[red]Error: Invalid JSON response[/red]")
-        sys.exit(1)
+        raise click.ClickException("Invalid JSON response")
+
+
+def make_requests_parallel(
+    specs: list[tuple[str, Optional[dict], Optional[str]]]
+) -> list[dict]:
+    """Dispatch several make_request calls concurrently.
+
+    Each spec is an (endpoint, params, api_key) tuple. The shared session's
+    connection pool is thread-safe for GETs, so independent endpoints
+    complete in max-of-RTTs instead of sum-of-RTTs.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(8, len(specs))) as pool:
+        futures = [pool.submit(make_request, *spec) for spec in specs]
+        return [future.result() for future in futures]
 
 
 def format_timestamp(iso_string: str) -> str:
     """Convert ISO timestamp to readable format."""
+    # Fast path: the displayed format is minute precision, so for normal
+    # "YYYY-MM-DDTHH:MM:SS..." strings slicing gives the answer directly
+    # without building a datetime per row.
+    if isinstance(iso_string, str) and len(iso_string) >= 16 and iso_string[10] == "T":
+        return iso_string[:10] + " " + iso_string[11:16]
     try:
         dt = datetime.fromisoformat(iso_string.replace("Z", "+00:00"))
         return dt.strftime("%Y-%m-%d %H:%M")
-    except:
+    except (ValueError, TypeError, AttributeError):
         return iso_string
 
 
@@ -108,7 +307,7 @@ def truncate_text(text: str, max_length: int = 200) -> str:
     """Truncate text with ellipsis."""
     if not text:
         return ""
-    text = text.replace("\n", " ").replace("\r", "")
+    text = text.translate(_TRUNC_TABLE)
     if len(text) > max_length:
         return text[:max_length].rstrip() + "..."
     return text
@@ -120,16 +319,141 @@ def maybe_truncate(text: str, max_length: int, no_truncate: bool) -> str:
     return truncate_text(text or "", max_length)
 
 
+def _extract_post_row(p: dict) -> tuple:
+    """One dict walk per post for the browse loop."""
+    author = p.get("author") or {}
+    return (
+        p.get("upvotes", 0),
+        p.get("title", "No title"),
+        author.get("name", "Unknown"),
+        p.get("comment_count", 0),
+        p.get("id", ""),
+        p.get("content", ""),
+    )
+
+
+def _extract_comment_row(c: dict) -> tuple:
+    """One dict walk per comment for the render loop."""
+    author = c.get("author") or {}
+    return (
+        author.get("name", "Unknown"),
+        c.get("upvotes", 0),
+        c.get("downvotes", 0),
+        c.get("created_at", ""),
+        c.get("content", ""),
+    )
+
+
+def extract_comments(data) -> list:
+    """Pull the comment list out of the API response, whatever its shape."""
+    if isinstance(data, list):
+        return data
+    comments_list = data.get("comments")
+    if comments_list is None:
+        comments_list = data.get("results", [])
+    return comments_list
+
+
+def render_post(post: dict, post_id: str):
+    """Print a full post as a rich panel plus its content."""
+    from rich.markup import escape
+    from rich.panel import Panel
+    from rich.text import Text
+
+    console = get_console()
+
+    title = post.get("title", "No title")
+    content = post.get("content", "")
+    author = (post.get("author") or {}).get("name", "Unknown")
+    upvotes = post.get("upvotes", 0)
+    downvotes = post.get("downvotes", 0)
+    comment_count = post.get("comment_count", 0)
+    created_at = format_timestamp(post.get("created_at", ""))
+    submolt = (post.get("submolt") or {}).get("display_name", "General")
+
+    # Header panel, built in one markup pass; API-supplied fields are escaped
+    # so bracketed text in them isn't read as style tags.
+    header = Text.from_markup(
+        f"[bold cyan]{escape(title)}[/bold cyan]\n\n"
+        f"[dim]Author:[/dim] [green]{escape(author)}[/green]\n"
+        f"[dim]Posted:[/dim] {created_at} in [magenta]{escape(submolt)}[/magenta]\n"
+        f"[dim]Engagement:[/dim] [green]{upvotes}👍[/green] "
+        f"[red]{downvotes}👎[/red] [blue]{comment_count}💬[/blue]"
+    )
+
+    console.print(Panel(header, title="🦞 Moltbook Post", border_style="cyan"))
+
+    # Content
+    if content:
+        console.print()
+        console.print(content)
+
+    console.print()
+    cprint(f"[dim]Post ID: {post_id}[/dim]")
+
+
+def render_comments(comments_list: list, no_truncate: bool = False):
+    """Print a list of comments as rich panels."""
+    from rich.markup import escape
+    from rich.panel import Panel
+    from rich.text import Text
+
+    console = get_console()
+    for c in comments_list:
+        author, upvotes, downvotes, created_at, content = _extract_comment_row(c)
+        created_at = format_timestamp(created_at)
+        content = maybe_truncate(content, 300, no_truncate)
+
+        # One markup pass per comment; the author name is escaped so
+        # bracketed text in it isn't read as style tags.
+        header = Text.from_markup(
+            f"[green]{escape(author)}[/green]\n"
+            f"[dim]Posted:[/dim] {created_at}\n"
+            f"[dim]Engagement:[/dim] [green]{upvotes}👍[/green] [red]{downvotes}👎[/red]"
+        )
+
+        console.print(Panel(header, title="💬 Comment", border_style="cyan"))
+        if content:
+            console.print(content)
+        console.print()
+
+
+def _warm_connection(session):
+    """Pre-resolve DNS and open a pooled connection in the background.
+
+    Runs while click is still dispatching and rich is importing, so the
+    command's real request finds a warm socket in the pool. The session is
+    constructed by the caller: lru_cache doesn't lock around the wrapped
+    call, so building it here could race the main thread's first request
+    and warm a session that gets discarded.
+    """
+    try:
+        session.head(BASE_URL, timeout=2)
+    except Exception:
+        pass
+
+
 @click.group()
 @click.version_option(version="1.0.0")
-def cli():
+@click.option("--no-cache", is_flag=True, help="Bypass the local response cache")
+@click.pass_context
+def cli(ctx: click.Context, no_cache: bool):
     """🦞 Moltbook Reader - Read AI agent social network content"""
-    pass
+    global _CACHE_DISABLED
+    _CACHE_DISABLED = no_cache
+    if ctx.invoked_subcommand in _NETWORK_COMMANDS:
+        session = get_session()
+        threading.Thread(target=_warm_connection, args=(session,), daemon=True).start()
+
+
+def _clamp_limit(ctx, param, value: int) -> int:
+    """Clamp --limit to the API maximum at parse time."""
+    return min(value, 50)
 
 
 @cli.command()
 @click.argument("query")
-@click.option("--limit", "-l", default=10, type=int, help="Number of results (max 50)")
+@click.option("--limit", "-l", default=10, type=int, callback=_clamp_limit, help="Number of results (max 50)")
 @click.option(
     "--type",
     "-t",
@@ -142,29 +466,56 @@ def cli():
 @click.option("--no-truncate", is_flag=True, help="Show full content text")
 def search(query: str, limit: int, content_type: str, json_out: bool, no_truncate: bool):
     """Search Moltbook content using semantic search (requires API key)"""
-    if not get_api_key():
-        console.print("[yellow]Warning: No API key found. Search requires authentication.[/yellow]")
-        console.print("[dim]Set MOLTBOOK_API_KEY env var or save key to ~/.config/moltbook/credentials.json[/dim]\n")
+    console = get_console()
+    api_key = resolve_api_key()
+    if not api_key:
+        cprint("[yellow]Warning: No API key found. Search requires authentication.[/yellow]")
+        cprint("[dim]Set MOLTBOOK_API_KEY env var or save key to ~/.config/moltbook/credentials.json[/dim]\n")
 
-    params = {"q": query, "limit": min(limit, 50)}
+    params = {"q": query, "limit": limit}
     if content_type != "all":
         params["type"] = content_type
 
-    data = make_request("search", params, auth=True)
+    data = make_request("search", params, api_key=api_key)
 
     if json_out:
-        console.print_json(json.dumps(data))
+        emit_json(data)
         return
 
     results = data.get("results", [])
 
     if not results:
-        console.print("[yellow]No results found[/yellow]")
+        cprint("[yellow]No results found[/yellow]")
+        return
+
+    # Build all cell strings up front so dict walks and truncation aren't
+    # interleaved with rich's per-row layout work.
+    rows = []
+    for r in results:
+        result_type = r.get("type", "unknown")
+        title = r.get("title") or r.get("content", "")
+        item_id = r.get("id") if result_type == "post" else r.get("post_id", "")
+        rows.append(
+            (
+                result_type.upper(),
+                item_id or "",
+                maybe_truncate(title, 50, no_truncate),
+                (r.get("author") or {}).get("name", "Unknown"),
+                str(r.get("upvotes", 0)),
+                f"{r.get('similarity', 0):.0%}",
+            )
+        )
+
+    # Piped output: skip rich's layout engine and emit tab-separated lines.
+    if not console.is_terminal:
+        console.file.write("".join("\t".join(row) + "\n" for row in rows))
         return
 
     console.print(f'\n[bold cyan]Search Results for:[/bold cyan] "{query}"')
     console.print(f"[dim]Found {len(results)} results\n[/dim]")
 
+    from rich.table import Table
+
     table = Table(show_header=True, header_style="bold magenta")
     table.add_column("Type", style="cyan", width=8)
     table.add_column("ID", style="dim", min_width=12)
@@ -173,22 +524,8 @@ def search(query: str, limit: int, content_type: str, json_out: bool, no_truncat
     table.add_column("👍", style="yellow", width=6, justify="right")
     table.add_column("Match", style="blue", width=6, justify="right")
 
-    for r in results:
-        content_type = r.get("type", "unknown")
-        title = r.get("title") or r.get("content", "")
-        author = r.get("author", {}).get("name", "Unknown")
-        upvotes = r.get("upvotes", 0)
-        similarity = r.get("similarity", 0)
-        item_id = r.get("id") if content_type == "post" else r.get("post_id", "")
-
-        table.add_row(
-            content_type.upper(),
-            item_id or "",
-            maybe_truncate(title, 50, no_truncate),
-            author,
-            str(upvotes),
-            f"{similarity:.0%}",
-        )
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
     console.print()
@@ -202,7 +539,7 @@ def search(query: str, limit: int, content_type: str, json_out: bool, no_truncat
     type=click.Choice(["hot", "new", "top", "rising"]),
     help="Sort order",
 )
-@click.option("--limit", "-l", default=20, type=int, help="Number of posts (max 50)")
+@click.option("--limit", "-l", default=20, type=int, callback=_clamp_limit, help="Number of posts (max 50)")
 @click.option("--offset", "-o", default=0, type=int, help="Pagination offset")
 @click.option("--json-out", "-j", is_flag=True, help="Output raw JSON")
 @click.option("--show-ids", is_flag=True, help="Show full post IDs on separate lines")
@@ -216,59 +553,47 @@ def browse(
     no_truncate: bool,
 ):
     """Browse posts from Moltbook"""
-    params = {"sort": sort, "limit": min(limit, 50), "offset": offset}
+    params = {"sort": sort, "limit": limit, "offset": offset}
 
     data = make_request("posts", params)
 
     if json_out:
-        console.print_json(json.dumps(data))
+        emit_json(data)
         return
 
     posts = data.get("posts", [])
 
     if not posts:
-        console.print("[yellow]No posts found[/yellow]")
+        cprint("[yellow]No posts found[/yellow]")
         return
 
-    console.print(f"\n[bold cyan]{sort.upper()} Posts[/bold cyan]")
-    console.print(f"[dim]Showing {len(posts)} posts (offset: {offset})\n[/dim]")
+    cprint(f"\n[bold cyan]{sort.upper()} Posts[/bold cyan]")
+    cprint(f"[dim]Showing {len(posts)} posts (offset: {offset})\n[/dim]")
 
     for post in posts:
-        upvotes = post.get("upvotes", 0)
-        title = post.get("title", "No title")
-        author = post.get("author", {}).get("name", "Unknown")
-        comment_count = post.get("comment_count", 0)
-        post_id = post.get("id", "")
-
-        # Color based on upvotes
-        if upvotes > 10000:
-            vote_color = "bold red"
-        elif upvotes > 1000:
-            vote_color = "bold yellow"
-        elif upvotes > 100:
-            vote_color = "green"
-        else:
-            vote_color = "dim"
+        upvotes, title, author, comment_count, post_id, content = _extract_post_row(post)
 
-        console.print(
-            f"[{vote_color}]{upvotes:>6}👍[/{vote_color}] [bold]{title}[/bold]"
+        # Color based on upvotes (bisect_left keeps the old strict > cutoffs)
+        vote_color = _VOTE_COLORS[bisect.bisect_left(_VOTE_BUCKETS, upvotes)]
+
+        cprint(
+            f"[{vote_color}]{upvotes:>6}👍[/{vote_color}] [bold]{escape_markup(title)}[/bold]"
         )
-        console.print(f"      [dim]by {author} | {comment_count} comments[/dim]")
+        cprint(f"      [dim]by {escape_markup(author)} | {comment_count} comments[/dim]")
         if show_ids:
-            console.print(f"      ID: {post_id}")
+            cprint(f"      ID: {post_id}")
 
         # Show content preview if available
-        content = post.get("content", "")
         if content:
             preview = maybe_truncate(content, 120, no_truncate)
-            console.print(f"      [italic]{preview}[/italic]")
+            cprint(f"      [italic]{escape_markup(preview)}[/italic]")
 
-        console.print()
+        cprint()
 
     # Show pagination info
     if data.get("has_more"):
         next_offset = data.get("next_offset", offset + limit)
-        console.print(
+        cprint(
             f"[dim]More posts available. Use --offset {next_offset} to see next page[/dim]"
         )
 
@@ -286,99 +611,111 @@ def browse(
 @click.option("--no-truncate", is_flag=True, help="Show full content text")
 def comments(post_id: str, sort: str, json_out: bool, no_truncate: bool):
     """Fetch comments for a specific post by ID (requires API key)"""
-    if not get_api_key():
-        console.print("[yellow]Warning: No API key found. Comments require authentication.[/yellow]")
-        console.print("[dim]Set MOLTBOOK_API_KEY env var or save key to ~/.config/moltbook/credentials.json[/dim]\n")
+    api_key = resolve_api_key()
+    if not api_key:
+        cprint("[yellow]Warning: No API key found. Comments require authentication.[/yellow]")
+        cprint("[dim]Set MOLTBOOK_API_KEY env var or save key to ~/.config/moltbook/credentials.json[/dim]\n")
 
-    data = make_request(f"posts/{post_id}/comments", {"sort": sort}, auth=True)
+    data = make_request(f"posts/{post_id}/comments", {"sort": sort}, api_key=api_key)
 
     if json_out:
-        console.print_json(json.dumps(data))
+        emit_json(data)
         return
 
-    if isinstance(data, list):
-        comments_list = data
-    else:
-        comments_list = data.get("comments")
-        if comments_list is None:
-            comments_list = data.get("results", [])
+    comments_list = extract_comments(data)
 
     if not comments_list:
-        console.print("[yellow]No comments found[/yellow]")
+        cprint("[yellow]No comments found[/yellow]")
         return
 
-    console.print(f"\n[bold cyan]Comments[/bold cyan]")
-    console.print(f"[dim]Post ID: {post_id} | Sort: {sort}[/dim]\n")
+    cprint(f"\n[bold cyan]Comments[/bold cyan]")
+    cprint(f"[dim]Post ID: {post_id} | Sort: {sort}[/dim]\n")
 
-    for c in comments_list:
-        author = c.get("author", {}).get("name", "Unknown")
-        upvotes = c.get("upvotes", 0)
-        downvotes = c.get("downvotes", 0)
-        created_at = format_timestamp(c.get("created_at", ""))
-        content = maybe_truncate(c.get("content", ""), 300, no_truncate)
-
-        header = Text()
-        header.append(f"{author}\n", style="green")
-        header.append("Posted: ", style="dim")
-        header.append(f"{created_at}\n")
-        header.append("Engagement: ", style="dim")
-        header.append(f"{upvotes}👍 ", style="green")
-        header.append(f"{downvotes}👎", style="red")
-
-        console.print(Panel(header, title="💬 Comment", border_style="cyan"))
-        if content:
-            console.print(content)
-        console.print()
+    render_comments(comments_list, no_truncate)
 
 
 @cli.command()
 @click.argument("post_id")
 @click.option("--json-out", "-j", is_flag=True, help="Output raw JSON")
-def fetch(post_id: str, json_out: bool):
+@click.option("--with-comments", is_flag=True, help="Also fetch the post's comments")
+def fetch(post_id: str, json_out: bool, with_comments: bool):
     """Fetch full content of a specific post by ID"""
-    data = make_request(f"posts/{post_id}")
+    comments_data = None
+    if with_comments:
+        # Fetch the post body and its comments in parallel over the shared pool
+        data, comments_data = make_requests_parallel(
+            [
+                (f"posts/{post_id}", None, None),
+                (f"posts/{post_id}/comments", {"sort": "top"}, resolve_api_key()),
+            ]
+        )
+    else:
+        data = make_request(f"posts/{post_id}")
 
     if json_out:
-        console.print_json(json.dumps(data))
+        if comments_data is not None:
+            data = dict(data)
+            data["comments"] = extract_comments(comments_data)
+        emit_json(data)
         return
 
     post = data.get("post")
 
     if not post:
-        console.print("[red]Post not found[/red]")
+        cprint("[red]Post not found[/red]")
         return
 
-    title = post.get("title", "No title")
-    content = post.get("content", "")
-    author = post.get("author", {}).get("name", "Unknown")
-    upvotes = post.get("upvotes", 0)
-    downvotes = post.get("downvotes", 0)
-    comment_count = post.get("comment_count", 0)
-    created_at = format_timestamp(post.get("created_at", ""))
-    submolt = post.get("submolt", {}).get("display_name", "General")
-
-    # Header panel
-    header = Text()
-    header.append(f"{title}\n\n", style="bold cyan")
-    header.append(f"Author: ", style="dim")
-    header.append(f"{author}\n", style="green")
-    header.append(f"Posted: ", style="dim")
-    header.append(f"{created_at} in ")
-    header.append(f"{submolt}\n", style="magenta")
-    header.append(f"Engagement: ", style="dim")
-    header.append(f"{upvotes}👍 ", style="green")
-    header.append(f"{downvotes}👎 ", style="red")
-    header.append(f"{comment_count}💬", style="blue")
+    render_post(post, post_id)
 
-    console.print(Panel(header, title="🦞 Moltbook Post", border_style="cyan"))
+    if comments_data is not None:
+        comments_list = extract_comments(comments_data)
+        if comments_list:
+            cprint(f"\n[bold cyan]Comments[/bold cyan]\n")
+            render_comments(comments_list)
+        else:
+            cprint("\n[yellow]No comments found[/yellow]")
 
-    # Content
-    if content:
-        console.print()
-        console.print(content)
 
-    console.print()
-    console.print(f"[dim]Post ID: {post_id}[/dim]")
+@cli.command()
+@click.argument("post_id")
+@click.option(
+    "--sort",
+    "-s",
+    default="top",
+    type=click.Choice(["top", "new", "controversial"]),
+    help="Comment sort order",
+)
+@click.option("--json-out", "-j", is_flag=True, help="Output raw JSON")
+@click.option("--no-truncate", is_flag=True, help="Show full content text")
+def thread(post_id: str, sort: str, json_out: bool, no_truncate: bool):
+    """Fetch a post and its comment thread in one round-trip of wall time"""
+    data, comments_data = make_requests_parallel(
+        [
+            (f"posts/{post_id}", None, None),
+            (f"posts/{post_id}/comments", {"sort": sort}, resolve_api_key()),
+        ]
+    )
+    comments_list = extract_comments(comments_data)
+
+    if json_out:
+        merged = dict(data)
+        merged["comments"] = comments_list
+        emit_json(merged)
+        return
+
+    post = data.get("post")
+
+    if not post:
+        cprint("[red]Post not found[/red]")
+        return
+
+    render_post(post, post_id)
+
+    if comments_list:
+        cprint(f"\n[bold cyan]Comments[/bold cyan] [dim](sort: {sort})[/dim]\n")
+        render_comments(comments_list, no_truncate)
+    else:
+        cprint("\n[yellow]No comments found[/yellow]")
 
 
 @cli.command()
@@ -386,35 +723,54 @@ def fetch(post_id: str, json_out: bool):
 @click.option("--json-out", "-j", is_flag=True, help="Output raw JSON")
 def submolts(limit: int, json_out: bool):
     """List all submolts (communities)"""
-    data = make_request("submolts")
+    console = get_console()
+    # Hint the server to pre-sort; unknown params are ignored, so the
+    # client-side ordering below stays as the guarantee.
+    data = make_request("submolts", {"sort": "subscribers"})
 
     if json_out:
-        console.print_json(json.dumps(data))
+        emit_json(data)
         return
 
     submolts_list = data.get("submolts", [])
 
     if not submolts_list:
-        console.print("[yellow]No submolts found[/yellow]")
+        cprint("[yellow]No submolts found[/yellow]")
         return
 
-    # Sort by subscriber count
-    submolts_list.sort(key=lambda x: x.get("subscriber_count", 0), reverse=True)
+    # Sort by subscriber count; extract the keys once so the comparison loop
+    # doesn't re-run .get O(N log N) times.
+    keys = [s.get("subscriber_count", 0) for s in submolts_list]
+    order = sorted(range(len(submolts_list)), key=keys.__getitem__, reverse=True)
+    submolts_list = [submolts_list[i] for i in order]
+
+    # Build all cell strings up front, then hand them to the renderer in one go.
+    rows = [
+        (
+            s.get("display_name", s.get("name", "Unknown")),
+            str(s.get("subscriber_count", 0)),
+            truncate_text(s.get("description", ""), 60),
+        )
+        for s in submolts_list[:limit]
+    ]
+
+    # Piped output: skip rich's layout engine and emit tab-separated lines.
+    if not console.is_terminal:
+        console.file.write("".join("\t".join(row) + "\n" for row in rows))
+        return
 
     console.print(f"\n[bold cyan]Submolts (Communities)[/bold cyan]")
     console.print(f"[dim]Total: {len(submolts_list)} communities\n[/dim]")
 
+    from rich.table import Table
+
     table = Table(show_header=True, header_style="bold magenta")
     table.add_column("Name", style="cyan", min_width=25)
     table.add_column("Subscribers", style="yellow", width=12, justify="right")
     table.add_column("Description", style="white", min_width=40)
 
-    for s in submolts_list[:limit]:
-        name = s.get("display_name", s.get("name", "Unknown"))
-        count = s.get("subscriber_count", 0)
-        desc = truncate_text(s.get("description", ""), 60)
-
-        table.add_row(name, str(count), desc)
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
     console.print()
@@ -423,6 +779,7 @@ def submolts(limit: int, json_out: bool):
 @cli.command()
 def stats():
     """Show Moltbook statistics"""
+    console = get_console()
     # Get submolts for total stats
     data = make_request("submolts")
 
@@ -432,6 +789,8 @@ def stats():
 
     console.print("\n[bold cyan]🦞 Moltbook Statistics[/bold cyan]\n")
 
+    from rich.table import Table
+
     stats_table = Table(show_header=False, box=None)
     stats_table.add_column("Metric", style="bold")
     stats_table.add_column("Value", style="cyan")
@@ -459,7 +818,8 @@ def stats():
 @cli.command()
 def whoami():
     """Check your Moltbook identity and API key status"""
-    api_key = get_api_key()
+    console = get_console()
+    api_key = resolve_api_key()
 
     if not api_key:
         console.print("[yellow]No API key configured.[/yellow]")
@@ -469,7 +829,7 @@ def whoami():
         return
 
     # Check agent status
-    data = make_request("agents/me", auth=True)
+    data = make_request("agents/me", api_key=api_key)
 
     if not data.get("success"):
         console.print(f"[red]Error: {data.get('error', 'Unknown error')}[/red]")
@@ -482,6 +842,8 @@ def whoami():
 
     console.print("\n[bold cyan]🦞 Moltbook Identity[/bold cyan]\n")
 
+    from rich.table import Table
+
     info_table = Table(show_header=False, box=None)
     info_table.add_column("Field", style="bold")
     info_table.add_column("Value", style="cyan")